@@ -6,6 +6,12 @@ import click
 from trickster.api_app import ApiApp
 from trickster.config import Config
 from trickster.sys import multi_glob, remove_file
+from trickster.validation import (
+    compiled_schemas_path,
+    generate_precompiled_json_schema,
+    get_compiled_schema_module,
+    schemas_path,
+)
 
 
 TESTABLE_FILES = ["trickster", "app.py", "cli.py"]
@@ -95,6 +101,16 @@ def check(ctx: click.Context) -> None:
         ctx.invoke(check)
 
 
+@cli.command("build-schemas")
+def build_schemas() -> None:
+    """Precompile bundled json schemas to python validators."""
+    for schema_path in sorted(schemas_path.glob("*.schema.json")):
+        module_name = get_compiled_schema_module(schema_path)
+        module_path = compiled_schemas_path / f"{module_name}.py"
+        module_path.write_text(generate_precompiled_json_schema(schema_path))
+        click.secho(f"Compiled: {schema_path.name} -> {module_path}", fg="green")
+
+
 @cli.command()
 def clean() -> None:
     """Remove all temp file."""
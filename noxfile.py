@@ -1,30 +1,88 @@
+import os
 from pathlib import Path
+from typing import List
 
+import nox
 from nox_poetry import Session, session
 
 HERE = Path(__file__).parent
 
+# Virtualenvs can be kept in a directory cached between CI runs
+nox.options.envdir = os.environ.get("NOX_ENV_DIR", ".nox")
+
 LOCATIONS = [
-    HERE / "tests",
-    HERE / "trickster",
-    HERE / "app.py",
-    HERE / "cli.py",
-    HERE / "gunicorn.conf.py",
-    HERE / "noxfile.py",
-    HERE / "setup.py",
+    str(HERE / location)
+    for location in (
+        "tests",
+        "trickster",
+        "app.py",
+        "cli.py",
+        "gunicorn.conf.py",
+        "noxfile.py",
+        "setup.py",
+    )
 ]
 
+PROJECT_FILES = [HERE / "pyproject.toml", HERE / "poetry.lock", HERE / "setup.py"]
+
+MISSING_PACKAGES_SCRIPT = """
+import importlib.metadata
+import sys
+
+for name in sys.argv[1:]:
+    try:
+        importlib.metadata.distribution(name)
+    except importlib.metadata.PackageNotFoundError:
+        print(name)
+"""
+
+
+def get_missing_packages(session: Session, *packages: str) -> List[str]:
+    """Get packages not yet installed in session virtualenv."""
+    output = session.run(
+        "python", "-c", MISSING_PACKAGES_SCRIPT, *packages, silent=True
+    )
+    return output.split() if isinstance(output, str) else list(packages)
+
+
+def fast_install(session: Session, *packages: str) -> None:
+    """Install only packages missing from a reused session virtualenv."""
+    if missing := get_missing_packages(session, *packages):
+        session.install(*missing)
+
+
+def get_sources_stamp() -> str:
+    """Get stamp identifying the current state of project sources."""
+    files = [*PROJECT_FILES, *(HERE / "trickster").rglob("*")]
+    return str(max(path.stat().st_mtime_ns for path in files if path.is_file()))
+
+
+def install_project(session: Session) -> None:
+    """Install project unless the same sources are already installed in session virtualenv."""
+    location = session.virtualenv.location
+    if not location:
+        session.install(".")
+        return
+
+    stamp_file = Path(location) / ".install-stamp"
+    stamp = get_sources_stamp()
+    if stamp_file.exists() and stamp_file.read_text() == stamp:
+        return
+
+    session.install(".")
+    stamp_file.write_text(stamp)
+
 
 @session(python=["3.8"])
 def test(session: Session) -> None:
-    session.install(".", "pytest", "pytest-mock")
-    session.run("pytest")
+    install_project(session)
+    fast_install(session, "pytest", "pytest-mock", "pytest-xdist")
+    session.run("pytest", "-n", "auto", "--dist=loadfile", *session.posargs)
 
 
 @session(python=["3.8"])
 def black(session: Session) -> None:
     args = session.posargs or LOCATIONS
-    args = [str(arg) for arg in args]
     session.install("black")
     session.run("black", *args)
 
@@ -32,7 +90,6 @@ def black(session: Session) -> None:
 @session(python=["3.8"])
 def lint(session: Session) -> None:
     args = session.posargs or LOCATIONS
-    args = [str(arg) for arg in args]
     session.install("flake8")
     session.install("flake8-import-order")
     session.run("flake8", "--import-order-style", "google", *args)
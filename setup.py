@@ -47,6 +47,7 @@ def main() -> None:
                 "pytest-repeat",
                 "pytest-cov",
                 "pytest-mock",
+                "pytest-xdist",
                 "mypy==0.910",
                 "twine",
             ]
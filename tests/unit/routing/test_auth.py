@@ -3,6 +3,7 @@ import hashlib
 
 import pytest
 import hmac
+import urllib.parse
 from werkzeug.exceptions import BadRequest
 
 from trickster.routing import (
@@ -38,6 +39,11 @@ class TestAuth:
         auth = Auth.deserialize({"method": None})
         assert isinstance(auth, NoAuth)
 
+    def test_implementations_are_registered(self):
+        assert Auth._find_implementation(None) is NoAuth
+        assert Auth._find_implementation("token") is TokenAuth
+        assert Auth._find_implementation("hmac") is HmacAuth
+
 
 @pytest.mark.unit
 class TestAuthWithResponse:
@@ -61,6 +67,19 @@ class TestAuthWithResponse:
         assert auth.token == "abcdefghi"
         assert auth.unauthorized_response.body == "unauthorized"
 
+    def test_deserialize_does_not_modify_data(self):
+        data = {
+            "method": "token",
+            "token": "abcdefghi",
+            "unauthorized_response": {"body": "x", "delay": 1, "headers": {}},
+        }
+        AuthWithResponse.deserialize(data)
+        assert data == {
+            "method": "token",
+            "token": "abcdefghi",
+            "unauthorized_response": {"body": "x", "delay": 1, "headers": {}},
+        }
+
 
 @pytest.mark.unit
 class TestNoAuth:
@@ -351,6 +370,45 @@ class TestHmacAuth:
         )
         auth.authenticate(request)
 
+    def test_authenticate_nested_path_with_port(self):
+        auth = HmacAuth(Response("", Delay()), "secret")
+        ts = time.time()
+        hash_maker = hmac.new("secret".encode("utf-8"), digestmod=hashlib.sha1)
+        hash_maker.update(f"/test/nested?hmac_timestamp={ts}".encode("utf-8"))
+        sign = hash_maker.hexdigest()
+        request = IncomingTestRequest(
+            base_url="http://localhost:8080/",
+            full_path=f"/test/nested?hmac_timestamp={ts}&hmac_sign={sign}",
+            method="GET",
+        )
+        auth.authenticate(request)
+
+    def test_authenticate_path_params_are_not_signed(self):
+        auth = HmacAuth(Response("", Delay()), "secret")
+        ts = time.time()
+        hash_maker = hmac.new("secret".encode("utf-8"), digestmod=hashlib.sha1)
+        hash_maker.update(f"/test/nested?hmac_timestamp={ts}".encode("utf-8"))
+        sign = hash_maker.hexdigest()
+        request = IncomingTestRequest(
+            base_url="http://localhost/",
+            full_path=f"/test/nested;params?hmac_timestamp={ts}&hmac_sign={sign}",
+            method="GET",
+        )
+        auth.authenticate(request)
+
+    def test_hash_url_uses_parsed_path(self):
+        auth = HmacAuth(Response("", Delay()), "secret")
+        for url in [
+            "http://localhost/a;x/b;y",
+            "http://localhost:8080/a;x",
+            "http://localhost/a#fragment",
+            "http://localhost/a#fragment?query",
+            "http://localhost",
+            "/a;x",
+        ]:
+            path = urllib.parse.urlparse(url).path
+            assert auth._hash_url(url, "q=1") == auth._hash_string(f"{path}?q=1")
+
     def test_missing_timestamp(self):
         auth = HmacAuth(Response("", Delay()), "secret")
         ts = time.time()
@@ -393,6 +451,36 @@ class TestHmacAuth:
         with pytest.raises(AuthenticationError):
             auth.authenticate(request)
 
+    def test_timestamp_not_finite(self):
+        auth = HmacAuth(Response("", Delay()), "secret")
+        for ts in ["nan", "inf", "-inf"]:
+            hash_maker = hmac.new("secret".encode("utf-8"), digestmod=hashlib.sha1)
+            hash_maker.update(f"/test?hmac_timestamp={ts}".encode("utf-8"))
+            sign = hash_maker.hexdigest()
+            request = IncomingTestRequest(
+                base_url="http://localhost/",
+                full_path=f"/test?hmac_timestamp={ts}&hmac_sign={sign}",
+                method="GET",
+            )
+
+            with pytest.raises(AuthenticationError):
+                auth.authenticate(request)
+
+    def test_timestamp_out_of_range(self):
+        auth = HmacAuth(Response("", Delay()), "secret")
+        for ts in ["1e20", "-1e20", "99999999999999"]:
+            hash_maker = hmac.new("secret".encode("utf-8"), digestmod=hashlib.sha1)
+            hash_maker.update(f"/test?hmac_timestamp={ts}".encode("utf-8"))
+            sign = hash_maker.hexdigest()
+            request = IncomingTestRequest(
+                base_url="http://localhost/",
+                full_path=f"/test?hmac_timestamp={ts}&hmac_sign={sign}",
+                method="GET",
+            )
+
+            with pytest.raises(AuthenticationError):
+                auth.authenticate(request)
+
     def test_signature_in_future(self):
         auth = HmacAuth(Response("", Delay()), "secret")
         ts = 13569465661  # 01/01/2400
@@ -419,3 +507,15 @@ class TestHmacAuth:
 
         with pytest.raises(AuthenticationError):
             auth.authenticate(request)
+
+    def test_non_ascii_sign(self):
+        auth = HmacAuth(Response("", Delay()), "secret")
+        ts = time.time()
+        request = IncomingTestRequest(
+            base_url="http://localhost/",
+            full_path=f"/test?hmac_timestamp={ts}&hmac_sign=ínválíd",
+            method="GET",
+        )
+
+        with pytest.raises(AuthenticationError):
+            auth.authenticate(request)
@@ -160,6 +160,28 @@ class TestResponseSelectionStrategy:
 
         assert r1.used_count < r2.used_count
 
+    def test_random_selection_skips_zero_weight(self):
+        strategy = ResponseSelectionStrategy.random
+        r1 = RouteResponse("id1", "", Delay(), weight=0.0)
+        r2 = RouteResponse("id2", "", Delay(), weight=0.5)
+        r3 = RouteResponse("id3", "", Delay(), weight=0.0)
+
+        for i in range(50):
+            assert strategy.select_response([r1, r2, r3]) is r2
+
+    def test_random_selection_all_zero_weights(self):
+        strategy = ResponseSelectionStrategy.random
+        r1 = RouteResponse("id1", "", Delay(), weight=0.0)
+        r2 = RouteResponse("id2", "", Delay(), weight=0.0)
+
+        assert strategy.select_response([r1, r2]) in [r1, r2]
+
+    def test_random_selection_no_active_response(self):
+        strategy = ResponseSelectionStrategy.random
+        r1 = RouteResponse("id1", "", Delay(), repeat=0)
+
+        assert strategy.select_response([r1]) is None
+
 
 @pytest.mark.unit
 class TestRoute:
@@ -198,6 +220,51 @@ class TestRoute:
         assert route.response_selection == ResponseSelectionStrategy.greedy
         assert route.is_active == True
 
+    def test_deserialize_reuses_compiled_patterns(self):
+        def deserialize():
+            return Route.deserialize(
+                {
+                    "id": "id1",
+                    "path": "/endpoint_\\w*",
+                    "method": "POST",
+                    "body": "body_\\w*",
+                    "body_matching_method": "regex",
+                    "responses": [{"body": ""}],
+                }
+            )
+
+        route1 = deserialize()
+        route2 = deserialize()
+
+        assert route1.path is route2.path
+        assert route1._body_pattern is route2._body_pattern
+        assert route1.body == "body_\\w*"
+        assert route1.body_matching_method == "regex"
+
+    def test_deserialize_does_not_modify_data(self):
+        data = {
+            "id": "id1",
+            "path": "/endpoint",
+            "responses": [{"body": "", "delay": 1, "headers": {}}],
+        }
+        Route.deserialize(data)
+        assert data == {
+            "id": "id1",
+            "path": "/endpoint",
+            "responses": [{"body": "", "delay": 1, "headers": {}}],
+        }
+
+    def test_deserialize_unknown_field(self):
+        with pytest.raises(RouteConfigurationError):
+            Route.deserialize(
+                {
+                    "id": "id1",
+                    "path": "/endpoint",
+                    "bdoy": "x",
+                    "responses": [{"body": ""}],
+                }
+            )
+
     def test_deserialize_duplicate_response_ids(self):
         with pytest.raises(RouteConfigurationError):
             route = Route.deserialize(
@@ -317,6 +384,36 @@ class TestRoute:
         )
         assert route.match(request)
 
+    def test_match_literal_path(self):
+        route = Route(
+            id="id1",
+            responses=[RouteResponse("id1", "", Delay())],
+            response_selection=ResponseSelectionStrategy.greedy,
+            path=re.compile(r"^/test"),
+            auth=NoAuth(),
+            method="GET",
+        )
+
+        assert route._match_path("/test")
+        assert route._match_path("/test_url")
+        assert not route._match_path("/tes")
+        assert not route._match_path("/url/test")
+
+    def test_match_exact_path(self):
+        route = Route(
+            id="id1",
+            responses=[RouteResponse("id1", "", Delay())],
+            response_selection=ResponseSelectionStrategy.greedy,
+            path=re.compile(r"/test$"),
+            auth=NoAuth(),
+            method="GET",
+        )
+
+        assert route._match_path("/test")
+        assert route._match_path("/test\n")
+        assert not route._match_path("/test_url")
+        assert not route._match_path("/test\n\n")
+
     def test_match_body_exact(self):
         route = Route(
             id="id1",
@@ -405,6 +502,19 @@ class TestRoute:
         )
         assert not route._match_body_regex("")
 
+    def test_unknown_body_matching_method(self):
+        with pytest.raises(RouteConfigurationError):
+            Route(
+                id="id1",
+                responses=[],
+                response_selection=ResponseSelectionStrategy.random,
+                path=re.compile(r"/test.*"),
+                auth=NoAuth(),
+                method="GET",
+                body="test",
+                body_matching_method="unknown",
+            )
+
     def test_select_response(self):
         response = RouteResponse("id1", "string", Delay())
         route = Route(
@@ -418,6 +528,45 @@ class TestRoute:
 
         assert route.select_response() is response
 
+    def test_select_response_cycle(self):
+        r1 = RouteResponse("id1", "", Delay(), repeat=2)
+        r2 = RouteResponse("id2", "", Delay(), repeat=3)
+        r3 = RouteResponse("id3", "", Delay(), repeat=0)
+        route = Route(
+            id="id1",
+            responses=[r1, r2, r3],
+            response_selection=ResponseSelectionStrategy.cycle,
+            path=re.compile(r"/test.*"),
+            auth=NoAuth(),
+            method="GET",
+        )
+
+        selected = []
+        while response := route.select_response():
+            selected.append(response)
+            route.use(response)
+
+        assert selected == [r1, r2, r1, r2, r2]
+
+    def test_select_response_random_skips_used_up_responses(self):
+        r1 = RouteResponse("id1", "", Delay(), repeat=1, weight=1.0)
+        r2 = RouteResponse("id2", "", Delay(), repeat=3, weight=0.0)
+        route = Route(
+            id="id1",
+            responses=[r1, r2],
+            response_selection=ResponseSelectionStrategy.random,
+            path=re.compile(r"/test.*"),
+            auth=NoAuth(),
+            method="GET",
+        )
+
+        selected = []
+        while response := route.select_response():
+            selected.append(response)
+            route.use(response)
+
+        assert selected == [r1, r2, r2, r2]
+
     def test_is_not_active_if_no_active_response(self):
         response = RouteResponse("id1", "string", Delay(), repeat=0)
         route = Route(
@@ -431,6 +580,47 @@ class TestRoute:
 
         assert route.is_active == 0
 
+    def test_is_not_active_when_responses_are_used_up(self):
+        response1 = RouteResponse("id1", "string", Delay(), repeat=1)
+        response2 = RouteResponse("id2", "string", Delay(), repeat=2)
+        route = Route(
+            id="id1",
+            responses=[response1, response2],
+            response_selection=ResponseSelectionStrategy.greedy,
+            path=re.compile(r"/test.*"),
+            auth=NoAuth(),
+            method="GET",
+        )
+
+        route.use(response1)
+        route.use(response2)
+        assert route.is_active
+        route.use(response2)
+        assert not route.is_active
+
+    def test_use_response_concurrently(self, mocker):
+        response = RouteResponse("id1", "string", Delay(), repeat=1)
+        route = Route(
+            id="id1",
+            responses=[response],
+            response_selection=ResponseSelectionStrategy.greedy,
+            path=re.compile(r"/test.*"),
+            auth=NoAuth(),
+            method="GET",
+        )
+        use = RouteResponse.use
+
+        def use_concurrently(self):
+            if route.used_count == 1:
+                route.use(self)  # Other request uses the response in the meantime
+            use(self)
+
+        mocker.patch.object(RouteResponse, "use", use_concurrently)
+        route.use(response)
+
+        assert response.used_count == 2
+        assert not route.is_active
+
     def test_authenticate(self):
         route = Route(
             id="id1",
@@ -445,6 +635,17 @@ class TestRoute:
         )
         route.authenticate(request)
 
+    def test_slots(self):
+        route = Route.deserialize(
+            {"id": "id1", "path": "/endpoint", "responses": [{"id": "r1", "body": ""}]}
+        )
+        response = route.get_response("r1")
+
+        assert not hasattr(route, "__dict__")
+        assert not hasattr(response, "__dict__")
+        assert route.id == "id1"
+        assert response.id == "r1"
+
 
 @pytest.mark.unit
 class TestRouter:
@@ -527,6 +728,178 @@ class TestRouter:
 
         assert router.match(request) is route
 
+    def test_match_exact_path_route(self):
+        router = Router()
+        route = router.add_route(
+            {
+                "id": "id1",
+                "path": "^/endpoint$",
+                "responses": [{"id": "response_1", "body": {"works": True}}],
+            }
+        )
+        request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="GET"
+        )
+        other_request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint_other", method="GET"
+        )
+
+        assert route.exact_path == "/endpoint"
+        assert router.match(request) is route
+        assert router.match(other_request) is None
+        # Same as `$` in regex, trailing newline is allowed
+        assert router._find_routes("GET", "/endpoint\n") == [route]
+
+    def test_match_first_defined_route(self):
+        router = Router()
+        pattern_route = router.add_route(
+            {
+                "id": "id1",
+                "path": "/endpoint\\w*",
+                "responses": [{"id": "response_1", "body": {"works": True}}],
+            }
+        )
+        exact_route = router.add_route(
+            {
+                "id": "id2",
+                "path": "/endpoint$",
+                "responses": [{"id": "response_1", "body": {"works": True}}],
+            }
+        )
+        request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="GET"
+        )
+
+        assert router.match(request) is pattern_route
+        router.remove_route("id1")
+        assert router.match(request) is exact_route
+
+    def test_match_inactive_exact_path_route(self):
+        router = Router()
+        exact_route = router.add_route(
+            {
+                "id": "id1",
+                "path": "/endpoint$",
+                "responses": [{"id": "response_1", "body": "", "repeat": 1}],
+            }
+        )
+        pattern_route = router.add_route(
+            {
+                "id": "id2",
+                "path": "/endpoint",
+                "responses": [{"id": "response_1", "body": ""}],
+            }
+        )
+        request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="GET"
+        )
+
+        assert router.match(request) is exact_route
+        exact_route.use(exact_route.select_response())
+        assert router.match(request) is pattern_route
+
+    def test_match_route_by_method(self):
+        router = Router()
+        post_route = router.add_route(
+            {
+                "id": "id1",
+                "path": "/endpoint",
+                "method": "POST",
+                "responses": [{"id": "response_1", "body": ""}],
+            }
+        )
+        get_route = router.add_route(
+            {
+                "id": "id2",
+                "path": "/endpoint",
+                "method": "GET",
+                "responses": [{"id": "response_1", "body": ""}],
+            }
+        )
+        post_request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="POST"
+        )
+        get_request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="GET"
+        )
+        put_request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="PUT"
+        )
+
+        assert router.match(post_request) is post_route
+        assert router.match(get_request) is get_route
+        assert router.match(put_request) is None
+
+    def test_match_pattern_routes_in_order_of_definition(self):
+        router = Router()
+        routes = [
+            router.add_route(
+                {
+                    "id": f"id{i}",
+                    "path": path,
+                    "responses": [{"id": "response_1", "body": ""}],
+                }
+            )
+            for i, path in enumerate(["/a", "/(b|c)", "/b\\w*", "(?i)/D", "/d", "/.*"])
+        ]
+
+        for path, expected in [
+            ("/a", routes[0]),
+            ("/b", routes[1]),
+            ("/c", routes[1]),
+            ("/d", routes[3]),
+            ("/D", routes[3]),
+            ("/e", routes[5]),
+        ]:
+            request = IncomingTestRequest(
+                base_url="http://localhost/", full_path=path, method="GET"
+            )
+            assert router.match(request) is expected
+
+    def test_match_cache_is_cleared_when_routes_change(self):
+        router = Router()
+        route1 = router.add_route(
+            {
+                "id": "id1",
+                "path": "/endpoint",
+                "responses": [{"id": "response_1", "body": ""}],
+            }
+        )
+        request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="GET"
+        )
+
+        assert router.match(request) is route1
+        route2 = router.update_route(
+            {"path": "/endpoint", "responses": [{"id": "response_1", "body": ""}]},
+            "id1",
+        )
+        assert router.match(request) is route2
+        router.remove_route("id1")
+        assert router.match(request) is None
+
+    def test_match_cache_size_is_limited(self, monkeypatch):
+        monkeypatch.setattr("trickster.routing.router.MATCH_CACHE_SIZE", 2)
+        router = Router()
+        router.add_route(
+            {
+                "id": "id1",
+                "path": "/endpoint",
+                "responses": [{"id": "response_1", "body": ""}],
+            }
+        )
+
+        for path in ["/endpoint1", "/endpoint2", "/endpoint3", "/endpoint2"]:
+            request = IncomingTestRequest(
+                base_url="http://localhost/", full_path=path, method="GET"
+            )
+            router.match(request)
+
+        assert list(router._match_cache) == [
+            ("GET", "/endpoint3"),
+            ("GET", "/endpoint2"),
+        ]
+
     def test_match_with_no_matching_route(self):
         router = Router()
         route = router.add_route(
@@ -609,3 +982,34 @@ class TestRouter:
         )
 
         assert len(router.routes) == 1
+
+    def test_reset_router_indexes_routes_once(self, mocker):
+        router = Router()
+        index_routes = mocker.spy(router, "_index_routes")
+        router.reset(
+            [
+                {"path": "/endpoint_1", "responses": [{"body": "response"}]},
+                {"path": "/endpoint_[0-9]", "responses": [{"body": "response"}]},
+            ]
+        )
+        request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint_2", method="GET"
+        )
+
+        assert index_routes.call_count == 1
+        assert router.match(request) is router.routes.items[1]
+
+    def test_reset_router_with_duplicate_routes_keeps_index(self):
+        router = Router()
+        with pytest.raises(DuplicateRouteError):
+            router.reset(
+                [
+                    {"id": "id1", "path": "/endpoint", "responses": [{"body": ""}]},
+                    {"id": "id1", "path": "/endpoint", "responses": [{"body": ""}]},
+                ]
+            )
+        request = IncomingTestRequest(
+            base_url="http://localhost/", full_path="/endpoint", method="GET"
+        )
+
+        assert router.match(request) is router.get_route("id1")
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 import flask
@@ -120,6 +122,14 @@ class TestResponse:
         response = Response("id", {"key": "value"}, Delay())
         response.serialize_body(context) == '{"key": "value"}'
 
+    def test_serialize_body_encodes_json_once(self, mocker):
+        context = ResponseContext({})
+        response = Response({"key": "value"}, Delay())
+        dumps = mocker.spy(json, "dumps")
+        assert response.serialize_body(context) == '{"key": "value"}'
+        assert response.serialize_body(context) == '{"key": "value"}'
+        assert dumps.call_count == 1
+
     def test_serialize_deserialize_complete(self):
         response = Response.deserialize(
             {
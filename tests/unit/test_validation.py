@@ -4,7 +4,18 @@ from pathlib import Path
 import flask
 from fastjsonschema.exceptions import JsonSchemaValueException
 
-from trickster.validation import request_schema, compile_json_schema, get_schema_path
+from trickster.compiled_schemas import request_schema as request_schema_module
+from trickster.validation import (
+    request_schema,
+    compile_json_schema,
+    get_schema_path,
+    get_validator,
+    is_compatible_version,
+    load_validators,
+    load_precompiled_json_schema,
+    schemas_path,
+    validate_many,
+)
 
 
 @pytest.mark.unit
@@ -20,6 +31,74 @@ class TestJsonSchemaValidation:
         validator2 = compile_json_schema(get_schema_path("route.schema.json"))
         assert validator1 is validator2
 
+    def test_get_validator_is_cached(self):
+        validator = compile_json_schema(get_schema_path("route.schema.json"))
+        assert get_validator("route.schema.json") is validator
+        assert get_validator("route.schema.json") is validator
+
+    def test_load_validators(self, mocker):
+        get_validator = mocker.patch("trickster.validation.get_validator")
+        load_validators()
+        loaded = {call.args[0] for call in get_validator.call_args_list}
+        assert loaded == {"request.schema.json", "route.schema.json"}
+
+    def test_compiled_json_schema_cache_invalidated_on_change(self, tmpdir):
+        schema = tmpdir.join("test.schema.json")
+        schema.write('{"type": "number"}')
+        validator1 = compile_json_schema(Path(schema))
+        schema.write('{"type": "string"}')
+        schema.setmtime(schema.mtime() + 10)
+        validator2 = compile_json_schema(Path(schema))
+        assert validator1 is not validator2
+        validator2("string")
+        with pytest.raises(JsonSchemaValueException):
+            validator2(1)
+
+    @pytest.mark.skipif(
+        not is_compatible_version(request_schema_module.VERSION),
+        reason="Bundled schemas were precompiled by incompatible fastjsonschema version",
+    )
+    def test_bundled_schemas_are_precompiled(self):
+        # Run `trickster build-schemas` if this fails
+        for schema_path in schemas_path.glob("*.schema.json"):
+            schema_text = schema_path.read_text()
+            validator = load_precompiled_json_schema(schema_path, schema_text)
+            assert validator is not None
+            assert compile_json_schema(schema_path) is validator
+
+    def test_outdated_precompiled_schema_is_not_used(self):
+        schema_path = get_schema_path("request.schema.json")
+        assert load_precompiled_json_schema(schema_path, "{}") is None
+
+    def test_validate_many(self):
+        errors = validate_many(
+            [
+                {"path": "/endpoint", "responses": [{"body": ""}]},
+                {"path": "/endpoint"},
+                {"path": "/endpoint", "responses": [{"body": "", "status": 200}]},
+            ],
+            "route.schema.json",
+        )
+
+        assert errors[0] is None
+        assert isinstance(errors[1], str) and errors[1]
+        assert errors[2] is None
+
+    def test_precompiled_schema_of_other_fastjsonschema_version_is_not_used(
+        self, mocker
+    ):
+        schema_path = get_schema_path("request.schema.json")
+        schema_text = schema_path.read_text()
+        mocker.patch("fastjsonschema.VERSION", "0.0.0")
+        assert load_precompiled_json_schema(schema_path, schema_text) is None
+
+    def test_is_compatible_version(self, mocker):
+        mocker.patch("fastjsonschema.VERSION", "2.17.1")
+        assert is_compatible_version("2.17.1")
+        assert is_compatible_version("2.22.2")
+        assert not is_compatible_version("1.17.1")
+        assert not is_compatible_version("3.0.0")
+
     def test_compile_valid_json_schema(self, tmpdir):
         schema = tmpdir.join("test.schema.json")
         schema.write(
@@ -60,6 +139,18 @@ class TestJsonSchemaValidation:
             assert response.data == b"success"
             assert response.status_code == 200
 
+    def test_schema_decorator_stores_validated_payload(self):
+        app = flask.Flask(__name__)
+
+        @app.route("/", methods=["POST"])
+        @request_schema("request.schema.json")
+        def endpoint():
+            return flask.jsonify(flask.g.validated_payload)
+
+        with app.test_client() as client:
+            response = client.post("/", json={"path": "/", "method": "GET"})
+            assert response.get_json() == {"path": "/", "method": "GET"}
+
     def test_invalid_schema_decorator(self):
         app = flask.Flask(__name__)
 
@@ -8,6 +8,7 @@ from flask import Flask, jsonify
 from trickster.config import Config
 from trickster.endpoints import external, internal, utility
 from trickster.routing.router import Router
+from trickster.validation import load_validators
 from werkzeug.exceptions import HTTPException
 
 
@@ -23,6 +24,7 @@ class ApiApp(Flask):
         super().__init__(__name__)
         self.config.from_object(config)
         self.user_router = Router()
+        load_validators()
         self.load_routes()
         self._register_handlers()
         self._register_blueprints()
@@ -7,8 +7,12 @@ from typing import Any, Dict, Generic, Iterator, List, Optional, TypeVar
 class IdItem(abc.ABC):
     """Item containing id and serializable to json."""
 
+    # Subclasses declare the "id" slot themselves, so that IdItem can be combined
+    # with other slotted base classes.
+    __slots__ = ()
+
     def __init__(self, id: str):
-        self.id = id
+        self.id = id  # type: ignore  # "id" slot is declared by subclasses
 
     def serialize(self) -> Dict[str, Any]:
         """Serialize item to json."""
@@ -33,7 +37,7 @@ class IdList(Generic[IdItemType]):
 
     def __iter__(self) -> Iterator[IdItemType]:
         """Iterate over all items in list."""
-        yield from self.items
+        return iter(self.items)
 
     def serialize(self) -> List[Dict[str, Any]]:
         """Convert list to json."""
@@ -41,7 +45,7 @@ class IdList(Generic[IdItemType]):
 
     def __contains__(self, key: str) -> bool:
         """Return True if item with given key is present in list."""
-        for item in self:
+        for item in self.items:
             if item.id == key:
                 return True
         return False
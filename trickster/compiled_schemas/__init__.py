@@ -0,0 +1 @@
+"""Json schemas precompiled to python validators."""
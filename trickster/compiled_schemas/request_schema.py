@@ -0,0 +1,36 @@
+"""Validator of request.schema.json, generated by `trickster build-schemas`."""
+
+VERSION = "2.17.1"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException
+
+
+NoneType = type(None)
+
+def validate_match_route(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'match_route', 'type': 'object', 'title': 'Match route schema', 'description': 'Validation schema for POST /internal/routes/match', 'properties': {'path': {'type': 'string', 'description': 'Path to be matched.'}, 'method': {'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}}, 'required': ['path', 'method'], 'additionalProperties': False}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_len = len(data)
+        if not all(prop in data for prop in ['path', 'method']):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain ['path', 'method'] properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'match_route', 'type': 'object', 'title': 'Match route schema', 'description': 'Validation schema for POST /internal/routes/match', 'properties': {'path': {'type': 'string', 'description': 'Path to be matched.'}, 'method': {'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}}, 'required': ['path', 'method'], 'additionalProperties': False}, rule='required')
+        data_keys = set(data.keys())
+        if "path" in data_keys:
+            data_keys.remove("path")
+            data__path = data["path"]
+            if not isinstance(data__path, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".path must be string", value=data__path, name="" + (name_prefix or "data") + ".path", definition={'type': 'string', 'description': 'Path to be matched.'}, rule='type')
+        if "method" in data_keys:
+            data_keys.remove("method")
+            data__method = data["method"]
+            if not isinstance(data__method, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".method must be string", value=data__method, name="" + (name_prefix or "data") + ".method", definition={'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, rule='type')
+            if data__method not in ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".method must be one of ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']", value=data__method, name="" + (name_prefix or "data") + ".method", definition={'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, rule='enum')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'match_route', 'type': 'object', 'title': 'Match route schema', 'description': 'Validation schema for POST /internal/routes/match', 'properties': {'path': {'type': 'string', 'description': 'Path to be matched.'}, 'method': {'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}}, 'required': ['path', 'method'], 'additionalProperties': False}, rule='additionalProperties')
+    return data
+
+SCHEMA_HASH = "3d406d38031e94153ca587b9a5e7efb45641f7c4decefc0daa099b5b9b17eb66"
+validate = validate_match_route
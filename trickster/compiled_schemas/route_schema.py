@@ -0,0 +1,346 @@
+"""Validator of route.schema.json, generated by `trickster build-schemas`."""
+
+VERSION = "2.17.1"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException
+
+
+REGEX_PATTERNS = {
+    '^[\\d\\w]+$': re.compile('^[\\d\\w]+\\Z')
+}
+
+NoneType = type(None)
+
+def validate_route(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'route', 'type': 'object', 'title': 'Add route scheme', 'description': 'Validation schema for POST /internal/route', 'definitions': {'response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'properties': {'id': {'type': 'string', 'description': 'Unique identifier of request.', 'pattern': '^[\\d\\w]+$'}, 'path': {'type': 'string', 'description': 'Path to be matched. Supports regular expresion. Starts with /.'}, 'method': {'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, 'body': {'type': 'string', 'description': 'Body to be matched. Supports regular expression.'}, 'body_matching_method': {'type': 'string', 'description': 'Method for matching body.', 'enum': ['exact', 'regex']}, 'response_selection': {'type': 'string', 'description': 'Strategy for selecting response.', 'enum': ['cycle', 'random', 'greedy']}, 'auth': {'description': 'Authentication method to be used.', 'anyOf': [{'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}]}, 'responses': {'type': 'array', 'description': 'List of responses to be returned.', 'items': {'type': 'object', 'description': 'Response to be returned.', 'allOf': [{'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, {'properties': {'id': {'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, 'repeat': {'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, 'weight': {'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}}}]}}}, 'required': ['path', 'responses'], 'additionalProperties': False}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_len = len(data)
+        if not all(prop in data for prop in ['path', 'responses']):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain ['path', 'responses'] properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'route', 'type': 'object', 'title': 'Add route scheme', 'description': 'Validation schema for POST /internal/route', 'definitions': {'response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'properties': {'id': {'type': 'string', 'description': 'Unique identifier of request.', 'pattern': '^[\\d\\w]+$'}, 'path': {'type': 'string', 'description': 'Path to be matched. Supports regular expresion. Starts with /.'}, 'method': {'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, 'body': {'type': 'string', 'description': 'Body to be matched. Supports regular expression.'}, 'body_matching_method': {'type': 'string', 'description': 'Method for matching body.', 'enum': ['exact', 'regex']}, 'response_selection': {'type': 'string', 'description': 'Strategy for selecting response.', 'enum': ['cycle', 'random', 'greedy']}, 'auth': {'description': 'Authentication method to be used.', 'anyOf': [{'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}]}, 'responses': {'type': 'array', 'description': 'List of responses to be returned.', 'items': {'type': 'object', 'description': 'Response to be returned.', 'allOf': [{'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, {'properties': {'id': {'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, 'repeat': {'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, 'weight': {'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}}}]}}}, 'required': ['path', 'responses'], 'additionalProperties': False}, rule='required')
+        data_keys = set(data.keys())
+        if "id" in data_keys:
+            data_keys.remove("id")
+            data__id = data["id"]
+            if not isinstance(data__id, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".id must be string", value=data__id, name="" + (name_prefix or "data") + ".id", definition={'type': 'string', 'description': 'Unique identifier of request.', 'pattern': '^[\\d\\w]+$'}, rule='type')
+            if isinstance(data__id, str):
+                if not REGEX_PATTERNS['^[\\d\\w]+$'].search(data__id):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".id must match pattern ^[\\d\\w]+$", value=data__id, name="" + (name_prefix or "data") + ".id", definition={'type': 'string', 'description': 'Unique identifier of request.', 'pattern': '^[\\d\\w]+$'}, rule='pattern')
+        if "path" in data_keys:
+            data_keys.remove("path")
+            data__path = data["path"]
+            if not isinstance(data__path, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".path must be string", value=data__path, name="" + (name_prefix or "data") + ".path", definition={'type': 'string', 'description': 'Path to be matched. Supports regular expresion. Starts with /.'}, rule='type')
+        if "method" in data_keys:
+            data_keys.remove("method")
+            data__method = data["method"]
+            if not isinstance(data__method, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".method must be string", value=data__method, name="" + (name_prefix or "data") + ".method", definition={'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, rule='type')
+            if data__method not in ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".method must be one of ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']", value=data__method, name="" + (name_prefix or "data") + ".method", definition={'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, rule='enum')
+        if "body" in data_keys:
+            data_keys.remove("body")
+            data__body = data["body"]
+            if not isinstance(data__body, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".body must be string", value=data__body, name="" + (name_prefix or "data") + ".body", definition={'type': 'string', 'description': 'Body to be matched. Supports regular expression.'}, rule='type')
+        if "body_matching_method" in data_keys:
+            data_keys.remove("body_matching_method")
+            data__bodymatchingmethod = data["body_matching_method"]
+            if not isinstance(data__bodymatchingmethod, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".body_matching_method must be string", value=data__bodymatchingmethod, name="" + (name_prefix or "data") + ".body_matching_method", definition={'type': 'string', 'description': 'Method for matching body.', 'enum': ['exact', 'regex']}, rule='type')
+            if data__bodymatchingmethod not in ['exact', 'regex']:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".body_matching_method must be one of ['exact', 'regex']", value=data__bodymatchingmethod, name="" + (name_prefix or "data") + ".body_matching_method", definition={'type': 'string', 'description': 'Method for matching body.', 'enum': ['exact', 'regex']}, rule='enum')
+        if "response_selection" in data_keys:
+            data_keys.remove("response_selection")
+            data__responseselection = data["response_selection"]
+            if not isinstance(data__responseselection, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".response_selection must be string", value=data__responseselection, name="" + (name_prefix or "data") + ".response_selection", definition={'type': 'string', 'description': 'Strategy for selecting response.', 'enum': ['cycle', 'random', 'greedy']}, rule='type')
+            if data__responseselection not in ['cycle', 'random', 'greedy']:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".response_selection must be one of ['cycle', 'random', 'greedy']", value=data__responseselection, name="" + (name_prefix or "data") + ".response_selection", definition={'type': 'string', 'description': 'Strategy for selecting response.', 'enum': ['cycle', 'random', 'greedy']}, rule='enum')
+        if "auth" in data_keys:
+            data_keys.remove("auth")
+            data__auth = data["auth"]
+            data__auth_any_of_count1 = 0
+            if not data__auth_any_of_count1:
+                try:
+                    if not isinstance(data__auth, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must be object", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, rule='type')
+                    data__auth_is_dict = isinstance(data__auth, dict)
+                    if data__auth_is_dict:
+                        data__auth_len = len(data__auth)
+                        if not all(prop in data__auth for prop in ['method', 'username', 'password']):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must contain ['method', 'username', 'password'] properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, rule='required')
+                        data__auth_keys = set(data__auth.keys())
+                        if "method" in data__auth_keys:
+                            data__auth_keys.remove("method")
+                            data__auth__method = data__auth["method"]
+                            if data__auth__method != "basic":
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.method must be same as const definition: basic", value=data__auth__method, name="" + (name_prefix or "data") + ".auth.method", definition={'const': 'basic'}, rule='const')
+                        if "username" in data__auth_keys:
+                            data__auth_keys.remove("username")
+                            data__auth__username = data__auth["username"]
+                            if not isinstance(data__auth__username, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.username must be string", value=data__auth__username, name="" + (name_prefix or "data") + ".auth.username", definition={'type': 'string', 'description': 'Username.'}, rule='type')
+                        if "password" in data__auth_keys:
+                            data__auth_keys.remove("password")
+                            data__auth__password = data__auth["password"]
+                            if not isinstance(data__auth__password, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.password must be string", value=data__auth__password, name="" + (name_prefix or "data") + ".auth.password", definition={'type': 'string', 'description': 'Password.'}, rule='type')
+                        if "unauthorized_response" in data__auth_keys:
+                            data__auth_keys.remove("unauthorized_response")
+                            data__auth__unauthorizedresponse = data__auth["unauthorized_response"]
+                            validate_route__definitions_response(data__auth__unauthorizedresponse, custom_formats, (name_prefix or "data") + ".auth.unauthorized_response")
+                        if data__auth_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must not contain "+str(data__auth_keys)+" properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, rule='additionalProperties')
+                    data__auth_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__auth_any_of_count1:
+                try:
+                    if not isinstance(data__auth, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must be object", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, rule='type')
+                    data__auth_is_dict = isinstance(data__auth, dict)
+                    if data__auth_is_dict:
+                        data__auth_len = len(data__auth)
+                        if not all(prop in data__auth for prop in ['method', 'name', 'value']):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must contain ['method', 'name', 'value'] properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, rule='required')
+                        data__auth_keys = set(data__auth.keys())
+                        if "method" in data__auth_keys:
+                            data__auth_keys.remove("method")
+                            data__auth__method = data__auth["method"]
+                            if data__auth__method != "cookie":
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.method must be same as const definition: cookie", value=data__auth__method, name="" + (name_prefix or "data") + ".auth.method", definition={'const': 'cookie'}, rule='const')
+                        if "name" in data__auth_keys:
+                            data__auth_keys.remove("name")
+                            data__auth__name = data__auth["name"]
+                            if not isinstance(data__auth__name, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.name must be string", value=data__auth__name, name="" + (name_prefix or "data") + ".auth.name", definition={'type': 'string', 'description': 'Name of the cookie.'}, rule='type')
+                        if "value" in data__auth_keys:
+                            data__auth_keys.remove("value")
+                            data__auth__value = data__auth["value"]
+                            if not isinstance(data__auth__value, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.value must be string", value=data__auth__value, name="" + (name_prefix or "data") + ".auth.value", definition={'type': 'string', 'description': 'Expected cookie value.'}, rule='type')
+                        if "unauthorized_response" in data__auth_keys:
+                            data__auth_keys.remove("unauthorized_response")
+                            data__auth__unauthorizedresponse = data__auth["unauthorized_response"]
+                            validate_route__definitions_response(data__auth__unauthorizedresponse, custom_formats, (name_prefix or "data") + ".auth.unauthorized_response")
+                        if data__auth_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must not contain "+str(data__auth_keys)+" properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, rule='additionalProperties')
+                    data__auth_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__auth_any_of_count1:
+                try:
+                    if not isinstance(data__auth, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must be object", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, rule='type')
+                    data__auth_is_dict = isinstance(data__auth, dict)
+                    if data__auth_is_dict:
+                        data__auth_len = len(data__auth)
+                        if not all(prop in data__auth for prop in ['method', 'key']):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must contain ['method', 'key'] properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, rule='required')
+                        data__auth_keys = set(data__auth.keys())
+                        if "method" in data__auth_keys:
+                            data__auth_keys.remove("method")
+                            data__auth__method = data__auth["method"]
+                            if data__auth__method != "hmac":
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.method must be same as const definition: hmac", value=data__auth__method, name="" + (name_prefix or "data") + ".auth.method", definition={'const': 'hmac'}, rule='const')
+                        if "key" in data__auth_keys:
+                            data__auth_keys.remove("key")
+                            data__auth__key = data__auth["key"]
+                            if not isinstance(data__auth__key, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.key must be string", value=data__auth__key, name="" + (name_prefix or "data") + ".auth.key", definition={'type': 'string', 'description': 'HMAC key'}, rule='type')
+                        if "unauthorized_response" in data__auth_keys:
+                            data__auth_keys.remove("unauthorized_response")
+                            data__auth__unauthorizedresponse = data__auth["unauthorized_response"]
+                            validate_route__definitions_response(data__auth__unauthorizedresponse, custom_formats, (name_prefix or "data") + ".auth.unauthorized_response")
+                        if data__auth_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must not contain "+str(data__auth_keys)+" properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, rule='additionalProperties')
+                    data__auth_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__auth_any_of_count1:
+                try:
+                    if not isinstance(data__auth, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must be object", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, rule='type')
+                    data__auth_is_dict = isinstance(data__auth, dict)
+                    if data__auth_is_dict:
+                        data__auth_len = len(data__auth)
+                        if not all(prop in data__auth for prop in ['method', 'fields']):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must contain ['method', 'fields'] properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, rule='required')
+                        data__auth_keys = set(data__auth.keys())
+                        if "method" in data__auth_keys:
+                            data__auth_keys.remove("method")
+                            data__auth__method = data__auth["method"]
+                            if data__auth__method != "form":
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.method must be same as const definition: form", value=data__auth__method, name="" + (name_prefix or "data") + ".auth.method", definition={'const': 'form'}, rule='const')
+                        if "fields" in data__auth_keys:
+                            data__auth_keys.remove("fields")
+                            data__auth__fields = data__auth["fields"]
+                            if not isinstance(data__auth__fields, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.fields must be object", value=data__auth__fields, name="" + (name_prefix or "data") + ".auth.fields", definition={'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, rule='type')
+                            data__auth__fields_is_dict = isinstance(data__auth__fields, dict)
+                            if data__auth__fields_is_dict:
+                                data__auth__fields_keys = set(data__auth__fields.keys())
+                                for data__auth__fields_key in data__auth__fields_keys:
+                                    if data__auth__fields_key not in []:
+                                        data__auth__fields_value = data__auth__fields.get(data__auth__fields_key)
+                                        if not isinstance(data__auth__fields_value, (str)):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.fields.{data__auth__fields_key}".format(**locals()) + " must be string", value=data__auth__fields_value, name="" + (name_prefix or "data") + ".auth.fields.{data__auth__fields_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "unauthorized_response" in data__auth_keys:
+                            data__auth_keys.remove("unauthorized_response")
+                            data__auth__unauthorizedresponse = data__auth["unauthorized_response"]
+                            validate_route__definitions_response(data__auth__unauthorizedresponse, custom_formats, (name_prefix or "data") + ".auth.unauthorized_response")
+                        if data__auth_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must not contain "+str(data__auth_keys)+" properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, rule='additionalProperties')
+                    data__auth_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__auth_any_of_count1:
+                try:
+                    if not isinstance(data__auth, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must be object", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}, rule='type')
+                    data__auth_is_dict = isinstance(data__auth, dict)
+                    if data__auth_is_dict:
+                        data__auth_len = len(data__auth)
+                        if not all(prop in data__auth for prop in ['method', 'token']):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must contain ['method', 'token'] properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}, rule='required')
+                        data__auth_keys = set(data__auth.keys())
+                        if "method" in data__auth_keys:
+                            data__auth_keys.remove("method")
+                            data__auth__method = data__auth["method"]
+                            if data__auth__method != "token":
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.method must be same as const definition: token", value=data__auth__method, name="" + (name_prefix or "data") + ".auth.method", definition={'const': 'token'}, rule='const')
+                        if "token" in data__auth_keys:
+                            data__auth_keys.remove("token")
+                            data__auth__token = data__auth["token"]
+                            if not isinstance(data__auth__token, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth.token must be string", value=data__auth__token, name="" + (name_prefix or "data") + ".auth.token", definition={'type': 'string', 'description': 'Token.'}, rule='type')
+                        if "unauthorized_response" in data__auth_keys:
+                            data__auth_keys.remove("unauthorized_response")
+                            data__auth__unauthorizedresponse = data__auth["unauthorized_response"]
+                            validate_route__definitions_response(data__auth__unauthorizedresponse, custom_formats, (name_prefix or "data") + ".auth.unauthorized_response")
+                        if data__auth_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth must not contain "+str(data__auth_keys)+" properties", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}, rule='additionalProperties')
+                    data__auth_any_of_count1 += 1
+                except JsonSchemaValueException: pass
+            if not data__auth_any_of_count1:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".auth cannot be validated by any definition", value=data__auth, name="" + (name_prefix or "data") + ".auth", definition={'description': 'Authentication method to be used.', 'anyOf': [{'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}]}, rule='anyOf')
+        if "responses" in data_keys:
+            data_keys.remove("responses")
+            data__responses = data["responses"]
+            if not isinstance(data__responses, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses must be array", value=data__responses, name="" + (name_prefix or "data") + ".responses", definition={'type': 'array', 'description': 'List of responses to be returned.', 'items': {'type': 'object', 'description': 'Response to be returned.', 'allOf': [{'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, {'properties': {'id': {'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, 'repeat': {'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, 'weight': {'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}}}]}}, rule='type')
+            data__responses_is_list = isinstance(data__responses, (list, tuple))
+            if data__responses_is_list:
+                data__responses_len = len(data__responses)
+                for data__responses_x, data__responses_item in enumerate(data__responses):
+                    if not isinstance(data__responses_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}]".format(**locals()) + " must be object", value=data__responses_item, name="" + (name_prefix or "data") + ".responses[{data__responses_x}]".format(**locals()) + "", definition={'type': 'object', 'description': 'Response to be returned.', 'allOf': [{'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, {'properties': {'id': {'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, 'repeat': {'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, 'weight': {'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}}}]}, rule='type')
+                    validate_route__definitions_response(data__responses_item, custom_formats, (name_prefix or "data") + ".responses[{data__responses_x}]".format(**locals()))
+                    data__responses_item_is_dict = isinstance(data__responses_item, dict)
+                    if data__responses_item_is_dict:
+                        data__responses_item_keys = set(data__responses_item.keys())
+                        if "id" in data__responses_item_keys:
+                            data__responses_item_keys.remove("id")
+                            data__responses_item__id = data__responses_item["id"]
+                            if not isinstance(data__responses_item__id, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].id".format(**locals()) + " must be string", value=data__responses_item__id, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].id".format(**locals()) + "", definition={'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, rule='type')
+                            if isinstance(data__responses_item__id, str):
+                                if not REGEX_PATTERNS['^[\\d\\w]+$'].search(data__responses_item__id):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].id".format(**locals()) + " must match pattern ^[\\d\\w]+$", value=data__responses_item__id, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].id".format(**locals()) + "", definition={'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, rule='pattern')
+                        if "repeat" in data__responses_item_keys:
+                            data__responses_item_keys.remove("repeat")
+                            data__responses_item__repeat = data__responses_item["repeat"]
+                            if not isinstance(data__responses_item__repeat, (int)) and not (isinstance(data__responses_item__repeat, float) and data__responses_item__repeat.is_integer()) or isinstance(data__responses_item__repeat, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].repeat".format(**locals()) + " must be integer", value=data__responses_item__repeat, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].repeat".format(**locals()) + "", definition={'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, rule='type')
+                            if isinstance(data__responses_item__repeat, (int, float, Decimal)):
+                                if data__responses_item__repeat < 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].repeat".format(**locals()) + " must be bigger than or equal to 1", value=data__responses_item__repeat, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].repeat".format(**locals()) + "", definition={'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, rule='minimum')
+                        if "weight" in data__responses_item_keys:
+                            data__responses_item_keys.remove("weight")
+                            data__responses_item__weight = data__responses_item["weight"]
+                            if not isinstance(data__responses_item__weight, (int, float, Decimal)) or isinstance(data__responses_item__weight, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].weight".format(**locals()) + " must be number", value=data__responses_item__weight, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].weight".format(**locals()) + "", definition={'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}, rule='type')
+                            if isinstance(data__responses_item__weight, (int, float, Decimal)):
+                                if data__responses_item__weight < 0.0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].weight".format(**locals()) + " must be bigger than or equal to 0.0", value=data__responses_item__weight, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].weight".format(**locals()) + "", definition={'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}, rule='minimum')
+                                if data__responses_item__weight > 1.0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".responses[{data__responses_x}].weight".format(**locals()) + " must be smaller than or equal to 1.0", value=data__responses_item__weight, name="" + (name_prefix or "data") + ".responses[{data__responses_x}].weight".format(**locals()) + "", definition={'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}, rule='maximum')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'route', 'type': 'object', 'title': 'Add route scheme', 'description': 'Validation schema for POST /internal/route', 'definitions': {'response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'properties': {'id': {'type': 'string', 'description': 'Unique identifier of request.', 'pattern': '^[\\d\\w]+$'}, 'path': {'type': 'string', 'description': 'Path to be matched. Supports regular expresion. Starts with /.'}, 'method': {'type': 'string', 'description': 'HTTP method to be mathed. Uppercase.', 'enum': ['GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'CONNECT', 'OPTIONS', 'TRACE', 'PATCH']}, 'body': {'type': 'string', 'description': 'Body to be matched. Supports regular expression.'}, 'body_matching_method': {'type': 'string', 'description': 'Method for matching body.', 'enum': ['exact', 'regex']}, 'response_selection': {'type': 'string', 'description': 'Strategy for selecting response.', 'enum': ['cycle', 'random', 'greedy']}, 'auth': {'description': 'Authentication method to be used.', 'anyOf': [{'type': 'object', 'description': 'Authentication using base64 username and password.', 'properties': {'method': {'const': 'basic'}, 'username': {'type': 'string', 'description': 'Username.'}, 'password': {'type': 'string', 'description': 'Password.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'username', 'password'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a cookie value.', 'properties': {'method': {'const': 'cookie'}, 'name': {'type': 'string', 'description': 'Name of the cookie.'}, 'value': {'type': 'string', 'description': 'Expected cookie value.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'name', 'value'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using a HMAC sign.', 'properties': {'method': {'const': 'hmac'}, 'key': {'type': 'string', 'description': 'HMAC key'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'key'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using form data.', 'properties': {'method': {'const': 'form'}, 'fields': {'type': 'object', 'description': 'Key:Value pairs expected in the form.', 'additionalProperties': {'type': 'string'}}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'fields'], 'additionalProperties': False}, {'type': 'object', 'description': 'Authentication using toke bearer in header.', 'properties': {'method': {'const': 'token'}, 'token': {'type': 'string', 'description': 'Token.'}, 'unauthorized_response': {'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}}, 'required': ['method', 'token'], 'additionalProperties': False}]}, 'responses': {'type': 'array', 'description': 'List of responses to be returned.', 'items': {'type': 'object', 'description': 'Response to be returned.', 'allOf': [{'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, {'properties': {'id': {'type': 'string', 'description': 'Unique identifier of response.', 'pattern': '^[\\d\\w]+$'}, 'repeat': {'type': 'integer', 'description': "Number of times response can be used before it's discarded.", 'minimum': 1}, 'weight': {'type': 'number', 'description': 'Weight of the response if random selection is used.', 'minimum': 0.0, 'maximum': 1.0}}}]}}}, 'required': ['path', 'responses'], 'additionalProperties': False}, rule='additionalProperties')
+    return data
+
+def validate_route__definitions_response(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_len = len(data)
+        if not all(prop in data for prop in ['body']):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain ['body'] properties", value=data, name="" + (name_prefix or "data") + "", definition={'$id': 'response', 'type': 'object', 'description': 'Response to be returned.', 'properties': {'status': {'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, 'headers': {'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, 'body': {'description': 'Value to be returned.'}, 'delay': {'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}}, 'required': ['body']}, rule='required')
+        data_keys = set(data.keys())
+        if "status" in data_keys:
+            data_keys.remove("status")
+            data__status = data["status"]
+            if not isinstance(data__status, (int)) and not (isinstance(data__status, float) and data__status.is_integer()) or isinstance(data__status, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be integer", value=data__status, name="" + (name_prefix or "data") + ".status", definition={'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, rule='type')
+            if isinstance(data__status, (int, float, Decimal)):
+                if data__status < 100:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be bigger than or equal to 100", value=data__status, name="" + (name_prefix or "data") + ".status", definition={'type': 'integer', 'description': 'HTTP status to be returned.', 'minimum': 100}, rule='minimum')
+        if "headers" in data_keys:
+            data_keys.remove("headers")
+            data__headers = data["headers"]
+            if not isinstance(data__headers, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".headers must be object", value=data__headers, name="" + (name_prefix or "data") + ".headers", definition={'type': 'object', 'description': 'Extra headers to be returned.', 'additionalProperties': {'type': 'string'}}, rule='type')
+            data__headers_is_dict = isinstance(data__headers, dict)
+            if data__headers_is_dict:
+                data__headers_keys = set(data__headers.keys())
+                for data__headers_key in data__headers_keys:
+                    if data__headers_key not in []:
+                        data__headers_value = data__headers.get(data__headers_key)
+                        if not isinstance(data__headers_value, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".headers.{data__headers_key}".format(**locals()) + " must be string", value=data__headers_value, name="" + (name_prefix or "data") + ".headers.{data__headers_key}".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "body" in data_keys:
+            data_keys.remove("body")
+            data__body = data["body"]
+        if "delay" in data_keys:
+            data_keys.remove("delay")
+            data__delay = data["delay"]
+            data__delay_any_of_count2 = 0
+            if not data__delay_any_of_count2:
+                try:
+                    if not isinstance(data__delay, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay must be array", value=data__delay, name="" + (name_prefix or "data") + ".delay", definition={'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, rule='type')
+                    data__delay_is_list = isinstance(data__delay, (list, tuple))
+                    if data__delay_is_list:
+                        data__delay_len = len(data__delay)
+                        if data__delay_len > 0:
+                            data__delay__0 = data__delay[0]
+                            if not isinstance(data__delay__0, (int, float, Decimal)) or isinstance(data__delay__0, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay[0] must be number", value=data__delay__0, name="" + (name_prefix or "data") + ".delay[0]", definition={'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, rule='type')
+                            if isinstance(data__delay__0, (int, float, Decimal)):
+                                if data__delay__0 < 0.0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay[0] must be bigger than or equal to 0.0", value=data__delay__0, name="" + (name_prefix or "data") + ".delay[0]", definition={'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, rule='minimum')
+                        if data__delay_len > 1:
+                            data__delay__1 = data__delay[1]
+                            if not isinstance(data__delay__1, (int, float, Decimal)) or isinstance(data__delay__1, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay[1] must be number", value=data__delay__1, name="" + (name_prefix or "data") + ".delay[1]", definition={'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}, rule='type')
+                            if isinstance(data__delay__1, (int, float, Decimal)):
+                                if data__delay__1 < 0.0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay[1] must be bigger than or equal to 0.0", value=data__delay__1, name="" + (name_prefix or "data") + ".delay[1]", definition={'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}, rule='minimum')
+                    data__delay_any_of_count2 += 1
+                except JsonSchemaValueException: pass
+            if not data__delay_any_of_count2:
+                try:
+                    if not isinstance(data__delay, (int, float, Decimal)) or isinstance(data__delay, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay must be number", value=data__delay, name="" + (name_prefix or "data") + ".delay", definition={'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}, rule='type')
+                    if isinstance(data__delay, (int, float, Decimal)):
+                        if data__delay < 0.0:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay must be bigger than or equal to 0.0", value=data__delay, name="" + (name_prefix or "data") + ".delay", definition={'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}, rule='minimum')
+                    data__delay_any_of_count2 += 1
+                except JsonSchemaValueException: pass
+            if not data__delay_any_of_count2:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".delay cannot be validated by any definition", value=data__delay, name="" + (name_prefix or "data") + ".delay", definition={'description': 'Min and max delay in seconds of the response.', 'anyOf': [{'type': 'array', 'items': [{'type': 'number', 'description': 'Minimal delay.', 'minimum': 0.0}, {'type': 'number', 'description': 'Maximal delay.', 'minimum': 0.0}]}, {'type': 'number', 'description': 'Fixed delay.', 'minimum': 0.0}]}, rule='anyOf')
+    return data
+
+SCHEMA_HASH = "870472aa63285f4146ce12aff7fe68c15ead384df772ecf33d814a98c9cb5ed4"
+validate = validate_route
@@ -6,6 +6,7 @@ from flask import (
     abort,
     Blueprint,
     current_app,
+    g,
     jsonify,
     make_response,
     request,
@@ -37,7 +38,7 @@ def get_all_routes() -> Response:
 def add_route() -> Response:
     """Create new route."""
     try:
-        route = current_app.user_router.add_route(request.get_json())  # type: ignore
+        route = current_app.user_router.add_route(g.validated_payload)  # type: ignore
         return make_response(jsonify(route.serialize()), 201)
     except RouteConfigurationError as error:
         abort(error.http_code, str(error))
@@ -63,7 +64,7 @@ def get_route(route_id: str) -> Response:
 def replace_route(route_id: str) -> Response:
     """Replace route with new data."""
     try:
-        route = current_app.user_router.update_route(request.get_json(), route_id)  # type: ignore
+        route = current_app.user_router.update_route(g.validated_payload, route_id)  # type: ignore
         return make_response(jsonify(route.serialize()), 201)
     except RouteConfigurationError as error:
         abort(error.http_code, str(error))
@@ -82,7 +83,7 @@ def remove_route(route_id: str) -> Response:
 @request_schema("request.schema.json")
 def match_route() -> Response:
     """Match configured routes against given request."""
-    payload = request.get_json()
+    payload = g.validated_payload
     incoming_request = IncomingTestRequest(
         base_url=request.host_url, full_path=payload["path"], method=payload["method"]
     )
@@ -79,6 +79,8 @@ class ResponseContext:
 class Response:
     """Container for predefined response."""
 
+    __slots__ = ("body", "delay", "headers", "status", "used_count", "_json_body")
+
     def __init__(
         self,
         body: Any,
@@ -91,13 +93,16 @@ class Response:
         self.headers = headers or {}
         self.status = status
         self.used_count = 0
+        self._json_body: Optional[str] = None
 
     def serialize_body(self, context: ResponseContext) -> str:
         """Convert specified response body to string."""
         if isinstance(self.body, str):
             return self.body
-        else:
-            return json.dumps(self.body)
+        if self._json_body is None:
+            # Body doesn't change, encode it only once
+            self._json_body = json.dumps(self.body)
+        return self._json_body
 
     def as_flask_response(self, context: ResponseContext) -> flask.Response:
         """Convert Request to flask.Response suitable to return from an endpoint."""
@@ -128,16 +133,19 @@ class Response:
     @classmethod
     def deserialize(cls: Type[ResponseType], data: Dict[str, Any]) -> ResponseType:
         """Convert json to Response."""
-        delay = Delay.deserialize(data.pop("delay", None))
+        delay = Delay.deserialize(data.get("delay"))
 
         if "headers" in data:
-            headers = data.pop("headers")
+            headers = data["headers"]
         elif not isinstance(data["body"], str):
             headers = {"content-type": "application/json"}
         else:
             headers = {}
 
-        return cls(delay=delay, headers=headers, **data)
+        kwargs = {
+            key: value for key, value in data.items() if key not in ("delay", "headers")
+        }
+        return cls(delay=delay, headers=headers, **kwargs)
 
 
 # https://stackoverflow.com/questions/58986031/type-hinting-child-class-returning-self/58986197#58986197
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import abc
-import datetime
 import hashlib
 import hmac
-import re
-from typing import Any, Dict, Iterator, Optional, Tuple, Type
-import urllib.parse
+import math
+import time
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
 import basicauth
 from trickster.routing import (
@@ -20,15 +19,37 @@ from trickster.routing import (
 from trickster.routing.input import IncomingRequest
 
 
+_BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LENGTH = len(_BEARER_PREFIX)
+
+_MISSING = object()
+
+# Shared by all Auths without configured response, it's never used or modified.
+_DEFAULT_UNAUTHORIZED_RESPONSE = Response(
+    {"error": "Unauthorized", "message": "Authentication failed."},
+    Delay(0.0),
+    status=401,
+)
+
+
 class Auth(abc.ABC):
     """Authentication class."""
 
+    __slots__ = ()
+
     method: Optional[str] = None
+    _registry: ClassVar[Dict[Optional[str], Type[Auth]]] = {}
 
     def __init__(self, *args: Any, **kwargs: Any):  # pragma: no cover
         # Exists just make to make mypy happy.
         pass
 
+    def __init_subclass__(cls, **kwargs: Any):
+        """Register subclasses that define their own auth method."""
+        super().__init_subclass__(**kwargs)
+        if "method" in cls.__dict__:
+            Auth._registry[cls.method] = cls
+
     @abc.abstractmethod
     def authenticate(self, request: IncomingRequest) -> None:
         """Check if IncomingRequest contains valid authentication, raise exception if not."""
@@ -37,22 +58,15 @@ class Auth(abc.ABC):
     def serialize(self) -> Optional[Dict[str, Any]]:
         """Convert Auth to json value."""
 
-    @classmethod
-    def _get_subclasses(cls) -> Iterator[Type[Auth]]:
-        """Get all (direct and indirect) subclasses of this class."""
-        for subclass in cls.__subclasses__():
-            yield from subclass._get_subclasses()
-            yield subclass
-
     @classmethod
     def _find_implementation(cls, method: str) -> Type[Auth]:
         """Find a subclass implementing given auth method."""
-        for subclass in cls._get_subclasses():
-            if subclass.method == method:
-                return subclass
-        raise RouteConfigurationError(
-            f'Implementation of "{method}"" authentication method not found.'
-        )
+        try:
+            return cls._registry[method]
+        except KeyError:
+            raise RouteConfigurationError(
+                f'Implementation of "{method}"" authentication method not found.'
+            )
 
     @classmethod
     def deserialize(cls, data: Dict[str, Any]) -> Auth:
@@ -64,8 +78,8 @@ class Auth(abc.ABC):
             implementation = cls._find_implementation(data["method"])
             if issubclass(implementation, AuthWithResponse):
                 return AuthWithResponse.deserialize(data)
-            data.pop("method")
-            return implementation(**data)
+            kwargs = {key: value for key, value in data.items() if key != "method"}
+            return implementation(**kwargs)
         else:
             raise RouteConfigurationError('Missing field "method" of Auth.')
 
@@ -73,6 +87,8 @@ class Auth(abc.ABC):
 class NoAuth(Auth):
     """Placeholder authentication method. Doesn't perform authentication."""
 
+    __slots__ = ()
+
     method = None
 
     def authenticate(self, request: IncomingRequest) -> None:
@@ -87,6 +103,8 @@ class NoAuth(Auth):
 class AuthWithResponse(Auth, abc.ABC):
     """Authentication method with configured error response."""
 
+    __slots__ = ("unauthorized_response",)
+
     def __init__(self, unauthorized_response: Response):
         self.unauthorized_response = unauthorized_response
 
@@ -102,16 +120,16 @@ class AuthWithResponse(Auth, abc.ABC):
         """Convert json value to Auth."""
         if "method" in data:
             implementation = cls._find_implementation(data["method"])
-            data.pop("method")
-            if response_data := data.pop("unauthorized_response", None):
+            if response_data := data.get("unauthorized_response"):
                 response = Response.deserialize(response_data)
             else:
-                response = Response(
-                    {"error": "Unauthorized", "message": "Authentication failed."},
-                    Delay(0.0),
-                    status=401,
-                )
-            return implementation(response, **data)
+                response = _DEFAULT_UNAUTHORIZED_RESPONSE
+            kwargs = {
+                key: value
+                for key, value in data.items()
+                if key not in ("method", "unauthorized_response")
+            }
+            return implementation(response, **kwargs)
         else:
             raise RouteConfigurationError('Missing field "method" of Auth.')
 
@@ -119,6 +137,8 @@ class AuthWithResponse(Auth, abc.ABC):
 class TokenAuth(AuthWithResponse):
     """Authentication using http token in header."""
 
+    __slots__ = ("token",)
+
     method = "token"
 
     def __init__(self, unauthorized_response: Response, token: str):
@@ -134,11 +154,10 @@ class TokenAuth(AuthWithResponse):
 
     def _get_token(self, header: str) -> str:
         """Get authetication token from http header."""
-        match = re.match(r"Bearer (?P<token>.*)", header)
-        if not match:
+        if not header.startswith(_BEARER_PREFIX):
             raise AuthenticationError(f"Invalid authentication header {header}.")
 
-        return match["token"]
+        return header[_BEARER_PREFIX_LENGTH:]
 
     def authenticate(self, request: IncomingRequest) -> None:
         """Check if IncomingRequest contains valid token authentication, raise exception if not."""
@@ -159,12 +178,20 @@ class TokenAuth(AuthWithResponse):
 class BasicAuth(AuthWithResponse):
     """Authentication using username and password in http header."""
 
+    __slots__ = ("username", "password", "_credentials")
+
     method = "basic"
 
     def __init__(self, unauthorized_response: Response, username: str, password: str):
         super().__init__(unauthorized_response)
         self.username = username
         self.password = password
+        self._credentials = self._encode_credentials(username, password)
+
+    @staticmethod
+    def _encode_credentials(username: str, password: str) -> bytes:
+        """Encode username and password to bytes suitable for comparison."""
+        return f"{username}:{password}".encode("utf-8")
 
     def _get_header(self, request: IncomingRequest) -> str:
         """Get string containing base64 string containting username and password."""
@@ -184,7 +211,8 @@ class BasicAuth(AuthWithResponse):
         """Check if IncomingRequest contains valid username and password, raise exception if not."""
         token = self._get_header(request)
         username, password = self._get_username_password(token)
-        if username != self.username or password != self.password:
+        credentials = self._encode_credentials(username, password)
+        if not hmac.compare_digest(credentials, self._credentials):
             raise AuthenticationError(
                 f"Authentication {username}:{password} doens't match {self.username}:{self.password}."
             )
@@ -204,27 +232,33 @@ class BasicAuth(AuthWithResponse):
 class HmacAuth(AuthWithResponse):
     """Authentication using hmac signature in url."""
 
+    __slots__ = ("key", "_key_bytes", "past_tolerance", "future_tolerance")
+
     method = "hmac"
 
     def __init__(self, unauthorized_response: Response, key: str):
         super().__init__(unauthorized_response)
         self.key = key
+        self._key_bytes = key.encode("utf-8")
         self.past_tolerance = 3600
         self.future_tolerance = 5
 
     def _hash_string(self, url: str) -> str:
         """Hash given URL using HMAC with SHA1 digest."""
-        hash_maker = hmac.new(self.key.encode("utf-8"), digestmod=hashlib.sha1)
-        hash_maker.update(url.encode("utf-8"))
-        return hash_maker.hexdigest()
+        return hmac.new(self._key_bytes, url.encode("utf-8"), hashlib.sha1).hexdigest()
 
-    def _get_timestamp(self, args: Dict[str, str]) -> datetime.datetime:
+    def _get_timestamp(self, args: Dict[str, str]) -> float:
         """Get timestamp from url."""
         if "hmac_timestamp" not in args:
             raise AuthenticationError(
                 'HMAC authentication failed, URL is missing required parameter: "hmac_timestamp".'
             )
-        return datetime.datetime.fromtimestamp(float(args["hmac_timestamp"]))
+        timestamp = float(args["hmac_timestamp"])
+        if not math.isfinite(timestamp):
+            raise AuthenticationError(
+                f'HMAC authentication failed, "hmac_timestamp" is not a valid time: {timestamp}.'
+            )
+        return timestamp
 
     def _get_signature(self, args: Dict[str, str]) -> str:
         """Get hmac signature from url."""
@@ -234,39 +268,50 @@ class HmacAuth(AuthWithResponse):
             )
         return args["hmac_sign"]
 
-    def _check_time(self, timestamp: datetime.datetime) -> None:
-        """Check if given timestamp is within allowed bound."""
-        now = datetime.datetime.now()
+    def _check_time(self, timestamp: float) -> None:
+        """Check if given unix timestamp is within allowed bound."""
+        now = time.time()
 
-        if timestamp > now + datetime.timedelta(seconds=self.future_tolerance):
+        if timestamp > now + self.future_tolerance:
             raise AuthenticationError(
                 f"HMAC authentication failed, URL contains hmac_timestamp "
-                f"more than {self.future_tolerance} seconds in the future: {timestamp}"
+                f"more than {self.future_tolerance} seconds in the future: "
+                f"{timestamp}"
             )
 
-        if timestamp < now - datetime.timedelta(seconds=self.past_tolerance):
+        if timestamp < now - self.past_tolerance:
             raise AuthenticationError(
                 f"HMAC authentication failed, URL contains hmac_timestamp "
-                f"more than {self.past_tolerance} seconds in the past: {timestamp}"
+                f"more than {self.past_tolerance} seconds in the past: "
+                f"{timestamp}"
             )
 
     def _hash_url(self, url: str, query: str) -> str:
         """Calculate hash of used url using the hmac key."""
-        parsed_url = urllib.parse.urlparse(url)
-        hashable_url = parsed_url.path + "?" + re.sub(r"&hmac_sign=.*$", "", query)
-        return self._hash_string(hashable_url)
+        path = url.partition("#")[0].partition("?")[0]
+        if (scheme_end := path.find("://")) >= 0:
+            path_start = path.find("/", scheme_end + 3)
+            path = path[path_start:] if path_start >= 0 else ""
+        # Parameters of the last path segment are not signed, same as in `urlparse(url).path`
+        if (params_start := path.find(";", path.rfind("/"))) >= 0:
+            path = path[:params_start]
+        signed_query = query.partition("&hmac_sign=")[0]
+        return self._hash_string(f"{path}?{signed_query}")
 
     def _check_signature(self, url_hash: str, signature: str) -> None:
         """Check if signature matches expected hash."""
-        if not url_hash or url_hash != signature:
+        if not url_hash or not hmac.compare_digest(
+            url_hash.encode("utf-8"), signature.encode("utf-8")
+        ):
             raise AuthenticationError(
                 'HMAC authentication failed, hash in URL parameter "hmac_sign" is invalid.'
             )
 
     def authenticate(self, request: IncomingRequest) -> None:
         """Check if IncomingRequest contains valid authentication, raise exception if not."""
-        timestamp = self._get_timestamp(request.args)
-        signature = self._get_signature(request.args)
+        args = request.args
+        timestamp = self._get_timestamp(args)
+        signature = self._get_signature(args)
         url_hash = self._hash_url(request.url, request.query_string)
 
         self._check_signature(url_hash, signature)
@@ -282,22 +327,21 @@ class HmacAuth(AuthWithResponse):
 class FormAuth(AuthWithResponse):
     """Authentication using form data."""
 
+    __slots__ = ("fields",)
+
     method = "form"
 
     def __init__(self, unauthorized_response: Response, fields: Dict[str, str]):
         super().__init__(unauthorized_response)
         self.fields = fields
 
-    def _get_field(self, form: Dict[str, str], field: str) -> str:
-        """Get value of form field."""
-        if field not in form:
-            raise AuthenticationError(f'Missing authentication field "{field}".')
-        return form[field]
-
     def authenticate(self, request: IncomingRequest) -> None:
         """Check if IncomingRequest contains valid authentication, raise exception if not."""
+        form = request.form
         for field, value in self.fields.items():
-            sent_value = self._get_field(request.form, field)
+            sent_value = form.get(field, _MISSING)
+            if sent_value is _MISSING:
+                raise AuthenticationError(f'Missing authentication field "{field}".')
             if value != sent_value:
                 raise AuthenticationError(
                     f'Incorrect value "{sent_value}" in field "{field}", expected "{value}".'
@@ -313,6 +357,8 @@ class FormAuth(AuthWithResponse):
 class CookieAuth(AuthWithResponse):
     """Authentication using http cookie."""
 
+    __slots__ = ("name", "value")
+
     method = "cookie"
 
     def __init__(self, unauthorized_response: Response, name: str, value: str):
@@ -2,18 +2,91 @@
 
 from __future__ import annotations
 
+import bisect
+from collections import OrderedDict
 import enum
+import functools
+import heapq
 import random
 import re
-from typing import Any, Dict, Iterable, List, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 import uuid
 
 from trickster.collections import IdItem, IdList
-from trickster.routing import Delay, DuplicateRouteError, MissingRouteError, Response
-from trickster.routing.auth import Auth
+from trickster.routing import (
+    Delay,
+    DuplicateRouteError,
+    MissingRouteError,
+    Response,
+    RouteConfigurationError,
+)
+from trickster.routing.auth import Auth, NoAuth
 from trickster.routing.input import IncomingRequest
 
 
+MATCH_CACHE_SIZE = 1024
+
+PATTERN_CACHE_SIZE = 1024
+
+ROUTE_FIELDS = frozenset(
+    [
+        "id",
+        "responses",
+        "response_selection",
+        "path",
+        "auth",
+        "method",
+        "body",
+        "body_matching_method",
+    ]
+)
+
+REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]|()\\")
+
+
+def get_literal_path(pattern: re.Pattern) -> Optional[Tuple[str, bool]]:
+    """Return path matched by a pattern without special characters or None for other patterns.
+
+    Returned flag is True if pattern is anchored to the end and matches only the exact path
+    (optionally followed by a newline, same as `$`). Otherwise it matches all paths starting
+    with the returned path.
+    """
+    if pattern.flags != re.UNICODE:
+        return None
+
+    path = pattern.pattern
+    if path.startswith("^"):
+        path = path[1:]
+    exact = path.endswith("$")
+    if exact:
+        path = path[:-1]
+
+    if REGEX_SPECIAL_CHARACTERS.intersection(path):
+        return None
+    return path, exact
+
+
+INLINE_FLAGS = re.compile(r"\(\?[aiLmsux-]")
+
+
+def is_combinable(pattern: re.Pattern) -> bool:
+    """Return True if pattern can be joined with other patterns to one alternation.
+
+    Patterns with own groups could be broken by renumbering of groups, flags don't
+    apply only to a part of pattern.
+    """
+    if pattern.flags != re.UNICODE or pattern.groups:
+        return False
+    return not INLINE_FLAGS.search(pattern.pattern)
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile regex pattern, reusing patterns compiled for previous versions of routes."""
+    return re.compile(pattern)
+
+
 class ResponseSelectionStrategy(enum.Enum):
     """Strategy of how to select a RouteResponses from list of responses."""
 
@@ -24,51 +97,61 @@ class ResponseSelectionStrategy(enum.Enum):
     def select_response_cycle(
         self, responses: List[RouteResponse]
     ) -> Optional[RouteResponse]:
-        """Select proper response from list of candidate responses.
+        """Select proper response from list of active responses.
 
         Consumes responses in order of definition. Cycles through items one by one.
         """
         candidate = None
 
         for response in responses:
-            if response.is_active and (
-                candidate is None or response.used_count < candidate.used_count
-            ):
+            if candidate is None or response.used_count < candidate.used_count:
                 candidate = response
         return candidate
 
     def select_response_random(
         self, responses: List[RouteResponse]
     ) -> Optional[RouteResponse]:
-        """Select proper response from list of candidate responses.
+        """Select proper response from list of active responses.
 
         Selects random response from all available.
         """
-        population = [r for r in responses if r.is_active]
-        weights = [r.weight for r in population]
-        result = random.choices(population=population, weights=weights, k=1)
-        return result[0] if result else None
+        if not responses:
+            return None
+
+        cumulative_weights = []
+        total_weight = 0.0
+        for response in responses:
+            total_weight += response.weight
+            cumulative_weights.append(total_weight)
+
+        if total_weight <= 0:
+            return random.choice(responses)
+        index = bisect.bisect_right(
+            cumulative_weights, random.random() * total_weight, 0, len(responses) - 1
+        )
+        return responses[index]
 
     def select_response_greedy(
         self, responses: List[RouteResponse]
     ) -> Optional[RouteResponse]:
-        """Select proper response from list of candidate responses.
+        """Select proper response from list of active responses.
 
         Consumes responses in order of definition until the first one is exhausted,
         then starts consuming the next in the row.
         """
-        for response in responses:
-            if response.is_active:
-                return response
-        return None
+        return responses[0] if responses else None
 
     def select_response(
         self, responses: Iterable[RouteResponse]
     ) -> Optional[RouteResponse]:
         """Select proper response from list of candidate responses."""
-        method_name = f"select_response_{self.value}"
-        method = getattr(self, method_name)
-        return method(responses)
+        return self.select_active_response([r for r in responses if r.is_active])
+
+    def select_active_response(
+        self, responses: List[RouteResponse]
+    ) -> Optional[RouteResponse]:
+        """Select proper response from list of responses, that are known to be active."""
+        return _SELECTION_METHODS[self](self, responses)
 
     def serialize(self) -> str:
         """Convert ResponseSelectionStrategy to json."""
@@ -80,9 +163,18 @@ class ResponseSelectionStrategy(enum.Enum):
         return cls(method or "greedy")
 
 
+# Selection method of each strategy, resolved once instead of on every request
+_SELECTION_METHODS: Dict[ResponseSelectionStrategy, Callable] = {
+    strategy: getattr(ResponseSelectionStrategy, f"select_response_{strategy.value}")
+    for strategy in ResponseSelectionStrategy
+}
+
+
 class RouteResponse(Response, IdItem):
     """Container for predefined response in Route."""
 
+    __slots__ = ("id", "repeat", "weight", "is_active")
+
     def __init__(
         self,
         id: str,
@@ -97,6 +189,7 @@ class RouteResponse(Response, IdItem):
         IdItem.__init__(self, id)
         self.repeat = repeat
         self.weight = weight
+        self._update_is_active()
 
     def serialize(self) -> Dict[str, Any]:
         """Convert Response to json."""
@@ -108,15 +201,37 @@ class RouteResponse(Response, IdItem):
             "repeat": self.repeat,
         }
 
-    @property
-    def is_active(self) -> bool:
-        """Return True if response has some uses left."""
-        return self.repeat is None or self.repeat > self.used_count
+    def _update_is_active(self) -> None:
+        """Set is_active to True if response has some uses left."""
+        self.is_active = self.repeat is None or self.repeat > self.used_count
+
+    def use(self) -> None:
+        """Increases usage counter of RouteResponse and deactivates it when used up."""
+        Response.use(self)
+        self._update_is_active()
 
 
 class Route(IdItem):
     """Route is a pair of request arguments and all possible reponses."""
 
+    __slots__ = (
+        "id",
+        "response_selection",
+        "method",
+        "path",
+        "_literal_path",
+        "exact_path",
+        "auth",
+        "body",
+        "body_matching_method",
+        "_body_pattern",
+        "_body_matcher",
+        "used_count",
+        "responses",
+        "_active_responses",
+        "_cycle_heap",
+    )
+
     def __init__(
         self,
         id: str,
@@ -125,16 +240,25 @@ class Route(IdItem):
         path: re.Pattern,
         auth: Auth,
         method: str = "GET",
-        body: str = None,
+        body: Optional[str] = None,
         body_matching_method: str = "exact",
     ):
         super().__init__(id)
         self.response_selection = response_selection
-        self.method = method
+        self.method = sys.intern(method) if method else None
         self.path = path
+        literal_path = get_literal_path(path)
+        self._literal_path = literal_path[0] if literal_path else None
+        self.exact_path = literal_path[0] if literal_path and literal_path[1] else None
         self.auth = auth
         self.body = body
         self.body_matching_method = body_matching_method
+        self._body_pattern = (
+            _compile_pattern(body)
+            if body is not None and body_matching_method == "regex"
+            else None
+        )
+        self._body_matcher = self._get_body_matcher()
         self.used_count = 0
         self.responses: IdList[RouteResponse] = IdList()
 
@@ -144,6 +268,16 @@ class Route(IdItem):
         except KeyError:
             raise DuplicateRouteError(f"Duplicate response id {response.id}.")
 
+        self._active_responses = [r for r in self.responses if r.is_active]
+        self._cycle_heap: List[Tuple[int, int, RouteResponse]] = []
+        if response_selection is ResponseSelectionStrategy.cycle:
+            self._cycle_heap = [
+                (response.used_count, position, response)
+                for position, response in enumerate(self.responses)
+                if response.is_active
+            ]
+            heapq.heapify(self._cycle_heap)
+
     def serialize(self) -> Dict[str, Any]:
         """Convert Route to JSON."""
         return {
@@ -169,28 +303,28 @@ class Route(IdItem):
         result = []
         for response in responses:
             if "id" not in response:
-                response["id"] = str(uuid.uuid4())
+                response = {**response, "id": str(uuid.uuid4())}
             result.append(RouteResponse.deserialize(response))
         return result
 
     @classmethod
     def deserialize(cls, data: Dict[str, Any]) -> Route:
         """Convert json to Route."""
-        id = data.pop("id")
-        auth = Auth.deserialize(data.pop("auth", None))
-        path = re.compile(data.pop("path", None))
-        response_selection = ResponseSelectionStrategy.deserialize(
-            data.pop("response_selection", None)
-        )
-        responses = cls._create_responses(data.pop("responses"))
-
+        if unknown_fields := data.keys() - ROUTE_FIELDS:
+            raise RouteConfigurationError(
+                f'Unknown fields of Route: {", ".join(sorted(unknown_fields))}.'
+            )
         return cls(
-            id=id,
-            responses=responses,
-            response_selection=response_selection,
-            path=path,
-            auth=auth,
-            **data,
+            id=data["id"],
+            responses=cls._create_responses(data["responses"]),
+            response_selection=ResponseSelectionStrategy.deserialize(
+                data.get("response_selection")
+            ),
+            path=_compile_pattern(data["path"]),
+            auth=Auth.deserialize(data["auth"]) if "auth" in data else NoAuth(),
+            method=data.get("method", "GET"),
+            body=data.get("body"),
+            body_matching_method=data.get("body_matching_method", "exact"),
         )
 
     def use(self, response: RouteResponse = None) -> None:
@@ -198,37 +332,61 @@ class Route(IdItem):
         self.used_count += 1
         if response:
             response.use()
+            if not response.is_active:
+                try:
+                    self._active_responses.remove(response)
+                except ValueError:
+                    pass  # Already removed, e.g. by concurrent request using the same response
 
     def match(self, request: IncomingRequest) -> bool:
         """Return True, if this request specification matches given request and Route is active."""
-        return all(
-            [
-                self._match_method(request.method),
-                self._match_path(request.path),
-                self._match_body(request.body),
-                self.is_active,
-            ]
-        )
+        if not self.match_location(request.method, request.path):
+            return False
+        return self.match_content(request)
+
+    def match_location(self, method: Optional[str], path: str) -> bool:
+        """Return True, if this requests HTTP method and path match given values."""
+        return self._match_method(method) and self._match_path(path)
+
+    def match_content(self, request: IncomingRequest) -> bool:
+        """Return True, if Route is active and this requests body matches given InputRequest."""
+        return self.is_active and self._match_body(request.body)
 
     def _match_method(self, method: Optional[str]) -> bool:
         """Return True, if this requests HTTP method matches given InputRequest."""
-        return self.method in [None, method]
+        return self.method is None or self.method == method
 
     def _match_path(self, path: str) -> bool:
         """Return True, if this requests path matches given InputRequest."""
-        return bool(self.path.match(path))
-
-    def _match_body(self, body: str) -> bool:
-        """Return True, if this requests body matches given InputRequest."""
+        if self._literal_path is None:
+            return bool(self.path.match(path))
+        if self.exact_path is not None:
+            # `$` matches also before a trailing newline
+            return path == self.exact_path or path == self.exact_path + "\n"
+        return path.startswith(self._literal_path)
+
+    def _get_body_matcher(self) -> Optional[Callable[[str], bool]]:
+        """Return method matching request body using configured body matching method."""
         if self.body is None:
-            return True
+            return None
 
         matching_methods = {
             "exact": self._match_body_exact,
             "regex": self._match_body_regex,
         }
 
-        return matching_methods[self.body_matching_method](body)
+        try:
+            return matching_methods[self.body_matching_method]
+        except KeyError:
+            raise RouteConfigurationError(
+                f'Unknown body matching method "{self.body_matching_method}".'
+            )
+
+    def _match_body(self, body: str) -> bool:
+        """Return True, if this requests body matches given InputRequest."""
+        if self._body_matcher is None:
+            return True
+        return self._body_matcher(body)
 
     def _match_body_exact(self, body: str) -> bool:
         """Return True, if this requests body matches given InputRequest."""
@@ -236,13 +394,31 @@ class Route(IdItem):
 
     def _match_body_regex(self, body: str) -> bool:
         """Return True, if this requests body regex matches given InputRequest."""
-        if self.body is None:
+        if self._body_pattern is None:
             return False
-        return bool(re.match(self.body, body))
+        return bool(self._body_pattern.match(body))
 
     def select_response(self) -> Optional[RouteResponse]:
         """Select response from list of responses."""
-        return self.response_selection.select_response(self.responses)
+        if self.response_selection is ResponseSelectionStrategy.cycle:
+            return self._select_response_cycle()
+        return self.response_selection.select_active_response(self._active_responses)
+
+    def _select_response_cycle(self) -> Optional[RouteResponse]:
+        """Select response the same way as `ResponseSelectionStrategy.cycle` using a heap.
+
+        Heap entries are refreshed lazily, once they get to the top with outdated usage count.
+        """
+        heap = self._cycle_heap
+        while heap:
+            used_count, position, response = heap[0]
+            if not response.is_active:
+                heapq.heappop(heap)
+            elif used_count != response.used_count:
+                heapq.heapreplace(heap, (response.used_count, position, response))
+            else:
+                return response
+        return None
 
     def authenticate(self, request: IncomingRequest) -> None:
         """Check if Request if properly authenticated."""
@@ -251,10 +427,38 @@ class Route(IdItem):
     @property
     def is_active(self) -> bool:
         """Return True if Route has at least one active RouteResponse."""
-        for response in self.responses:
-            if response.is_active:
-                return True
-        return False
+        return bool(self._active_responses)
+
+
+class PatternRoutes:
+    """Routes matched by path pattern, in order of definition.
+
+    Combinable path patterns are joined to one alternation, so all routes before the first
+    one with matching path are skipped using a single regex call.
+    """
+
+    def __init__(self, routes: List[Tuple[int, Route]]):
+        self.routes = routes
+        self._first_uncombined = len(routes)
+        self._combined_indexes: List[int] = []
+        alternatives = []
+
+        for index, (_, route) in enumerate(routes):
+            if is_combinable(route.path):
+                self._combined_indexes.append(index)
+                alternatives.append(f"({route.path.pattern})")
+            else:
+                self._first_uncombined = min(self._first_uncombined, index)
+
+        self._combined = re.compile("|".join(alternatives)) if alternatives else None
+
+    def candidates(self, path: str) -> List[Tuple[int, Route]]:
+        """Return routes starting with the first one that can match given path."""
+        start = self._first_uncombined
+        match = self._combined.match(path) if self._combined else None
+        if match and match.lastindex:
+            start = min(start, self._combined_indexes[match.lastindex - 1])
+        return self.routes[start:]
 
 
 class Router:
@@ -266,9 +470,38 @@ class Router:
     def reset(self, routes: Optional[List[Dict[str, Any]]] = None) -> None:
         """Replace all custom routes."""
         self.routes: IdList[Route] = IdList()
-        if routes:
-            for route in routes:
-                self.add_route(route)
+        try:
+            for route in routes or []:
+                self._add_route(route)
+        finally:
+            self._index_routes()  # Index all routes at once instead of after each one
+
+    def _index_routes(self) -> None:
+        """Index routes and clear cache of matched routes. Must be called whenever routes change.
+
+        Routes with exact path can be found by a dict lookup, routes with path pattern are
+        grouped by HTTP method and scanned. Position of each route is kept so the first
+        defined matching route is found.
+        """
+        self._match_cache: OrderedDict[Tuple[str, str], List[Route]] = OrderedDict()
+        self._exact_path_routes: Dict[str, List[Tuple[int, Route]]] = {}
+        pattern_routes: List[Tuple[int, Route]] = []
+        for position, route in enumerate(self.routes.items):
+            if route.exact_path is not None:
+                routes = self._exact_path_routes.setdefault(route.exact_path, [])
+                routes.append((position, route))
+            else:
+                pattern_routes.append((position, route))
+
+        # Routes without method match requests with any method
+        methods: Set[Optional[str]] = {route.method for _, route in pattern_routes}
+        methods.add(None)
+        self._pattern_routes: Dict[Optional[str], PatternRoutes] = {
+            method: PatternRoutes(
+                [(p, r) for p, r in pattern_routes if r.method in (None, method)]
+            )
+            for method in methods
+        }
 
     def _generate_route_id(self) -> str:
         """Generate route id."""
@@ -281,8 +514,8 @@ class Router:
         """Set route id if it doesn't already exist. Generate id if not set."""
         route.setdefault("id", route_id or self._generate_route_id())
 
-    def add_route(self, route: Dict[str, Any]) -> Route:
-        """Add custom request and matching responses."""
+    def _add_route(self, route: Dict[str, Any]) -> Route:
+        """Add custom request and matching responses without indexing it."""
         self._set_route_id(route)
         route_object = Route.deserialize(route)
         try:
@@ -291,6 +524,12 @@ class Router:
             raise DuplicateRouteError(f'Route id "{route_object.id}" already exists.')
         return route_object
 
+    def add_route(self, route: Dict[str, Any]) -> Route:
+        """Add custom request and matching responses."""
+        route_object = self._add_route(route)
+        self._index_routes()
+        return route_object
+
     def get_route(self, route_id: str) -> Optional[Route]:
         """Get Route by its id."""
         return self.routes.get(route_id)
@@ -298,6 +537,7 @@ class Router:
     def remove_route(self, route_id: str) -> None:
         """Remove Route by its id."""
         self.routes.remove(route_id)
+        self._index_routes()
 
     def update_route(self, route: Dict[str, Any], route_id: str) -> Route:
         """Update route with completely new data."""
@@ -314,11 +554,38 @@ class Router:
             raise MissingRouteError(
                 f'Cannot update route "{route_id}". Route doesn\'t exist.'
             )
+        self._index_routes()
         return route_object
 
+    def _find_routes(self, method: str, path: str) -> List[Route]:
+        """Find all Routes matching given HTTP method and path in order of definition."""
+        pattern_routes = self._pattern_routes.get(method, self._pattern_routes[None])
+        candidates = [
+            *self._exact_path_routes.get(path, []),
+            *pattern_routes.candidates(path),
+        ]
+        if path.endswith("\n"):
+            # Exact paths ending with `$` match also before a trailing newline
+            candidates.extend(self._exact_path_routes.get(path[:-1], []))
+        matching_routes = [
+            (position, route)
+            for position, route in candidates
+            if route.match_location(method, path)
+        ]
+        matching_routes.sort(key=lambda item: item[0])
+        return [route for _, route in matching_routes]
+
     def match(self, incoming_request: IncomingRequest) -> Optional[Route]:
         """Find matching Route and return apropriet RouteResponse or None."""
-        for route in self.routes:
-            if route.match(incoming_request):
+        key = (incoming_request.method, incoming_request.path)
+        routes = self._match_cache.pop(key, None)
+        if routes is None:
+            routes = self._find_routes(*key)
+            if len(self._match_cache) >= MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        self._match_cache[key] = routes  # Most recently used are at the end
+
+        for route in routes:
+            if route.match_content(incoming_request):
                 return route
         return None
@@ -1,6 +1,7 @@
 """Helper function for interaction with the underlying operating system."""
 
 import glob
+import itertools
 import os
 import shutil
 from typing import Iterator, Optional
@@ -15,10 +16,8 @@ def remove_file(file_path: str) -> None:
 
 
 def multi_glob(*patterns: str) -> Iterator[str]:
-    """Perform glob search on all arguments."""
-    for pattern in patterns:
-        for file_path in glob.glob(pattern):
-            yield file_path
+    """Perform lazy glob search on all arguments."""
+    return itertools.chain.from_iterable(glob.iglob(pattern) for pattern in patterns)
 
 
 def get_env(variable: str) -> Optional[str]:
@@ -1,30 +1,36 @@
 """This module provides validation of Incoming requests."""
 
 import functools
+import hashlib
+import importlib
 import json
+import os
 import pathlib
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import fastjsonschema
 import flask
 
 
 schemas_path = pathlib.Path(__file__).parent / "schemas"
+compiled_schemas_path = pathlib.Path(__file__).parent / "compiled_schemas"
 
 
 def request_schema(schema_name: str) -> Callable:
     """Validate current request payload with given json schema.
 
     `request_schema` can be used only as a flask endpoint decorator. Must be
-    called within request scope.
+    called within request scope. Validated payload is stored in `flask.g.validated_payload`,
+    so the endpoint doesn't have to get it from the request again.
     """
 
     def request_schema_decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def request_schema_wrapper(*args: List[Any], **kwargs: Dict[str, Any]) -> Any:
             try:
-                payload = flask.request.get_json()
+                payload = flask.request.get_json(cache=True)
                 validate_json(payload, schema_name)
+                flask.g.validated_payload = payload
                 return func(*args, **kwargs)
             except fastjsonschema.JsonSchemaException as e:
                 flask.abort(400, e.message)
@@ -36,19 +42,122 @@ def request_schema(schema_name: str) -> Callable:
 
 def validate_json(json_data: Any, schema_name: str) -> None:
     """Validate json data with given schema."""
-    schema_path = get_schema_path(schema_name)
-    validator = compile_json_schema(schema_path)
+    validator = get_validator(schema_name)
     validator(json_data)
 
 
-@functools.lru_cache
+def validate_many(payloads: Sequence[Any], schema_name: str) -> List[Optional[str]]:
+    """Validate multiple json payloads with given schema.
+
+    Returns error message for each invalid payload or None for each valid payload.
+    """
+    validator = get_validator(schema_name)
+    errors: List[Optional[str]] = [None] * len(payloads)
+    for index, payload in enumerate(payloads):
+        try:
+            validator(payload)
+        except fastjsonschema.JsonSchemaException as e:
+            errors[index] = e.message
+    return errors
+
+
+def load_validators() -> None:
+    """Load validators of all bundled schemas so the first validated request doesn't wait."""
+    for schema_path in schemas_path.glob("*.schema.json"):
+        get_validator(schema_path.name)
+
+
+def get_validator(schema_name: str) -> Callable:
+    """Return validation function of schema with given name.
+
+    Same as `compile_json_schema`, but avoids creating `pathlib.Path` on every call.
+    """
+    schema_file = get_schema_file(schema_name)
+    return _compile_json_schema(schema_file, os.stat(schema_file).st_mtime_ns)
+
+
 def compile_json_schema(schema_path: pathlib.Path) -> Callable:
-    """Compiles given schema to fastjson validation function."""
-    with open(schema_path.absolute()) as schema_file:
-        schema = json.load(schema_file)
-        return fastjsonschema.compile(schema)
+    """Compiles given schema to fastjson validation function.
+
+    Compiled functions are cached until the schema file is modified.
+    """
+    absolute_path = schema_path.absolute()
+    return _compile_json_schema(str(absolute_path), absolute_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_json_schema(schema_path: str, mtime_ns: int) -> Callable:
+    """Compiles schema with given absolute path and modification time.
+
+    Uses validator precompiled by `trickster build-schemas` if it's up to date.
+    """
+    with open(schema_path) as schema_file:
+        schema_text = schema_file.read()
+    validator = load_precompiled_json_schema(pathlib.Path(schema_path), schema_text)
+    if validator:
+        return validator
+    return fastjsonschema.compile(json.loads(schema_text))
+
+
+def get_compiled_schema_module(schema_path: pathlib.Path) -> str:
+    """Return name of module containing precompiled schema validator."""
+    return schema_path.stem.replace(".", "_")
+
+
+def get_schema_hash(schema_text: str) -> str:
+    """Return hash identifying version of schema the validator was compiled from."""
+    return hashlib.sha256(schema_text.encode("utf-8")).hexdigest()
+
+
+def load_precompiled_json_schema(
+    schema_path: pathlib.Path, schema_text: str
+) -> Optional[Callable]:
+    """Load precompiled validator of bundled schema or None if it's missing or outdated.
+
+    Validator is outdated if the schema changed or if it was generated by a version of
+    fastjsonschema incompatible with the installed one.
+    """
+    if schema_path.parent != schemas_path.absolute():
+        return None
+    module_name = get_compiled_schema_module(schema_path)
+    try:
+        module = importlib.import_module(f"trickster.compiled_schemas.{module_name}")
+    except ImportError:
+        return None
+    if not is_compatible_version(module.VERSION):
+        return None
+    if module.SCHEMA_HASH != get_schema_hash(schema_text):
+        return None
+    return module.validate
+
+
+def is_compatible_version(version: str) -> bool:
+    """Return True if validator generated by given fastjsonschema version can be used.
+
+    Generated code is compatible with the installed fastjsonschema of the same major version.
+    """
+    return version.partition(".")[0] == fastjsonschema.VERSION.partition(".")[0]
+
+
+def generate_precompiled_json_schema(schema_path: pathlib.Path) -> str:
+    """Generate source code of module validating data with given schema."""
+    schema_text = schema_path.read_text()
+    schema = json.loads(schema_text)
+    entrypoint = fastjsonschema.compile(schema).__name__
+    return (
+        f'"""Validator of {schema_path.name}, generated by `trickster build-schemas`."""\n\n'
+        f"{fastjsonschema.compile_to_code(schema)}\n\n"
+        f'SCHEMA_HASH = "{get_schema_hash(schema_text)}"\n'
+        f"validate = {entrypoint}\n"
+    )
 
 
 def get_schema_path(schema_name: str) -> pathlib.Path:
     """Return path to json schema file."""
     return schemas_path / schema_name
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_file(schema_name: str) -> str:
+    """Return absolute path to json schema file as a string."""
+    return str(get_schema_path(schema_name).absolute())